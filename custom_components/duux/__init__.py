@@ -1,11 +1,14 @@
 # custom_components/duux/__init__.py
 
 import logging
+from collections import deque
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN
@@ -19,7 +22,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Duux from a config entry."""
     api = DuuxAPI(
         email=entry.data["email"],
-        password=entry.data["password"]
+        password=entry.data["password"],
+        async_session=async_get_clientsession(hass)
     )
     
     # Authenticate
@@ -33,23 +37,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("No Duux devices found")
         return False
     
-    # Create coordinator for each device
-    coordinators = {}
-    for device in devices:
-        coordinator = DuuxDataUpdateCoordinator(
-            hass,
-            api=api,
-            device_id=device.get("deviceId"),
-            device_name=device.get("displayName", "Duux Heater")
-        )
-        
-        await coordinator.async_config_entry_first_refresh()
-        coordinators[device["deviceId"]] = coordinator
+    # One coordinator polls every device with a single request
+    coordinator = DuuxDataUpdateCoordinator(
+        hass,
+        api=api,
+        devices=devices
+    )
+    await coordinator.async_config_entry_first_refresh()
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
-        "coordinators": coordinators,
+        "coordinator": coordinator,
         "devices": devices
     }
     
@@ -69,25 +68,192 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class DuuxDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Duux data."""
     
-    def __init__(self, hass, api, device_id, device_name):
+    def __init__(self, hass, api, devices):
         """Initialize."""
         self.api = api
-        self.device_id = device_id
-        self.device_name = device_name
+        self.devices = devices
+        self.device_ids = [device.get("deviceId") for device in devices]
+        # Presets per device MAC address, filled in by _async_setup
+        self.presets = {}
+        # Device MACs changed by the refresh in progress, None means all;
+        # set by _async_refresh_finished, consumed by async_update_listeners
+        self._changed_contexts = None
+        self._previous_data = {}
+        self._previous_success = False
         
         super().__init__(
             hass,
             _LOGGER,
-            name=f"Duux {device_name}",
+            name="Duux",
             update_interval=timedelta(seconds=30),
+            # _async_update_data builds a fresh dict on every poll, so
+            # unchanged polls can skip notifying listeners altogether
+            always_update=False,
         )
     
+    async def _async_setup(self):
+        """Discover the device presets once, before the first refresh."""
+        self.presets = {
+            device.get("deviceId"): self._discover_presets(device)
+            for device in self.devices
+        }
+
+    def _discover_presets(self, device):
+        """Build the preset list from the device availableModes block."""
+        full_data = (device.get("latestData") or {}).get("fullData") or {}
+        modes: Any = full_data.get("availableModes")
+        if modes is None:
+            modes = self._deep_find_first(device, "availableModes")
+
+        if isinstance(modes, list):
+            modes = next(
+                (
+                    candidate
+                    for candidate in modes
+                    if isinstance(candidate, dict) and candidate.get("settings")
+                ),
+                None,
+            )
+
+        if not isinstance(modes, dict):
+            _LOGGER.debug("No available modes found")
+            return []
+
+        settings = modes.get("settings")
+        if not isinstance(settings, list):
+            _LOGGER.debug("No settings found in available modes")
+            return []
+
+        command_prefix = (
+            modes.get("command_key") or modes.get("commandKey") or modes.get("key")
+        )
+
+        presets = []
+        for setting in settings:
+            if not isinstance(setting, dict):
+                continue
+
+            name = (
+                setting.get("setting_name")
+                or setting.get("settingName")
+                or setting.get("name")
+            )
+
+            value = (
+                setting.get("setting_value")
+                or setting.get("settingValue")
+                or setting.get("value")
+            )
+
+            command = setting.get("command")
+            if command is None and command_prefix and value is not None:
+                command = f"{command_prefix} {value}"
+            elif command is None:
+                command = value
+
+            # Names are kept raw: entities normalize them per model
+            if command is not None:
+                presets.append(
+                    {
+                        "name": name,
+                        "command": str(command),
+                        "value": None if value is None else str(value),
+                    }
+                )
+
+        _LOGGER.debug("Discovered presets: %s", presets)
+
+        return presets
+
+    @staticmethod
+    def _deep_find_first(obj: Any, key: str) -> Any:
+        """Return the first value for `key` inside a nested dict/list structure."""
+        stack = deque([obj])
+        while stack:
+            current = stack.popleft()
+            if isinstance(current, dict):
+                if key in current:
+                    return current[key]
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+        return None
+
+    @callback
+    def _async_refresh_finished(self):
+        """Work out which devices changed since the previous refresh.
+
+        Called by DataUpdateCoordinator right before it updates listeners.
+        """
+        # Start from "notify everyone" so a set from an earlier refresh whose
+        # notification was skipped can never leak into this one
+        self._changed_contexts = None
+        if self.last_update_success and self._previous_success:
+            changed = {
+                device_id
+                for device_id, status in self.data.items()
+                if self._previous_data.get(device_id) != status
+            }
+            # Nothing changed means always_update=False skips the notification,
+            # so only keep a filter that async_update_listeners will consume
+            self._changed_contexts = changed or None
+        self._previous_success = self.last_update_success
+        if self.last_update_success:
+            self._previous_data = self.data
+
+    @callback
+    def async_update_listeners(self):
+        """Update the listeners of the devices changed by the last refresh.
+
+        When availability changed, or outside of a refresh, every listener is
+        updated like in DataUpdateCoordinator.
+        """
+        changed_contexts, self._changed_contexts = self._changed_contexts, None
+        self.async_update_listeners_by_context(changed_contexts)
+
+    @callback
+    def async_update_listeners_by_context(self, contexts):
+        """Update the listeners registered for the given device MACs.
+
+        This is the only place listeners are filtered; None updates them all.
+        """
+        if contexts is None:
+            super().async_update_listeners()
+            return
+        # DataUpdateCoordinator keeps each listener's context only in
+        # _listeners (async_contexts() drops the callbacks), so it is read
+        # directly; it maps remove callbacks to (update_callback, context)
+        for update_callback, context in list(self._listeners.values()):
+            if context in contexts:
+                update_callback()
+
     async def _async_update_data(self):
         """Fetch data from API."""
         try:
-            data = await self.hass.async_add_executor_job(
-                self.api.get_device_status, self.device_id
-            )
+            devices = await self.api.async_get_devices()
+
+            statuses = {
+                device.get("deviceId"): (device.get("latestData") or {}).get("fullData") or {}
+                for device in devices
+            }
+
+            data = {}
+            for device_id in self.device_ids:
+                status = statuses.get(device_id) or {}
+                # Normalize once per poll so entity properties can use plain lookups
+                if status.get("mode") is not None:
+                    status["mode"] = str(status["mode"])
+                if status.get("heatin") is not None:
+                    try:
+                        status["heatin"] = int(status["heatin"])
+                    except (TypeError, ValueError):
+                        # Keep the other devices updating, drop the bad value only
+                        _LOGGER.warning(
+                            "Ignoring invalid heatin value %s for %s",
+                            status["heatin"], device_id
+                        )
+                        status.pop("heatin")
+                data[device_id] = status
             return data
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
\ No newline at end of file
+            raise UpdateFailed(f"Error communicating with API: {err}")
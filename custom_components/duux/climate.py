@@ -1,6 +1,6 @@
 """Support for Duux climate devices."""
 import logging
-from typing import Any, Iterator
+from typing import Any
 
 from homeassistant.components.climate import (
     ClimateEntity
@@ -12,7 +12,7 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -28,43 +28,47 @@ async def async_setup_entry(
     """Set up Duux climate entities."""
     data = hass.data[DOMAIN][entry.entry_id]
     api = data["api"]
-    coordinators = data["coordinators"]
+    coordinator = data["coordinator"]
     devices = data["devices"]
     
-    entities = []
-    for device in devices:
-        sensor_type_id = device.get("sensorTypeId")
-        device_id = device["deviceId"]
-        coordinator = coordinators[device_id]
-        # Create the appropriate climate entity based on heater type
-        if sensor_type_id == 49:  # Threesixty 2023
-            entities.append(DuuxThreesixtyClimate(coordinator, api, device))
-        elif sensor_type_id == 50:  # Edge heater v2
-            entities.append(DuuxEdgeClimate(coordinator, api, device))
-        elif sensor_type_id == 31:  # Threesixty Two (2022)
-            entities.append(DuuxThreesixtyTwoClimate(coordinator, api, device))
-        else:
-            # Fallback to generic entity for unknown types
-            entities.append(DuuxClimateAutoDiscovery(coordinator, api, device))
-            _LOGGER.warning(f"Unknown heater type {sensor_type_id}, using generic entity")
+    entities = [
+        _entity_class(device.get("sensorTypeId"))(coordinator, api, device)
+        for device in devices
+    ]
     
     async_add_entities(entities)
 
 
+def _entity_class(sensor_type_id):
+    """Return the climate entity class for a heater type."""
+    if (entity_class := _ENTITY_CLASSES.get(sensor_type_id)) is None:
+        # Fallback to generic entity for unknown types
+        _LOGGER.warning(f"Unknown heater type {sensor_type_id}, using generic entity")
+        return DuuxClimateAutoDiscovery
+    return entity_class
+
+
 class DuuxClimate(CoordinatorEntity, ClimateEntity):
     """Representation of a Duux climate device."""
 
     def __init__(self, coordinator, api, device):
         """Initialize the climate device."""
-        super().__init__(coordinator)
+        # Only wake up when this device's data changes
+        super().__init__(coordinator, context=device["deviceId"])
         self._api = api
-        self._coordinator = coordinator
         self._device = device
         self._device_id = device["id"]
         self._device_mac = device["deviceId"]  # MAC address
         self._attr_unique_id = f"duux_{self._device_id}"
         self._attr_name = device.get("displayName") or device.get("name")
         self._attr_has_entity_name = True
+        self._attr_available = coordinator.last_update_success
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, str(self._device_id))},
+            "name": self._attr_name,
+            "manufacturer": device.get("manufacturer", "Duux"),
+            "model": (device.get("sensorType") or {}).get("name", "Unknown"),
+        }
         
         # Default temperature range (can be overridden by subclasses)
         self._attr_min_temp = 18
@@ -73,6 +77,8 @@ class DuuxClimate(CoordinatorEntity, ClimateEntity):
 
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+        # Subclasses set their own preset modes
+        self._attr_preset_modes = ()
         self._attr_supported_features = (
             ClimateEntityFeature.TARGET_TEMPERATURE | 
             ClimateEntityFeature.PRESET_MODE |
@@ -80,30 +86,20 @@ class DuuxClimate(CoordinatorEntity, ClimateEntity):
             ClimateEntityFeature.TURN_ON
         )
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, str(self._device_id))},
-            "name": self._attr_name,
-            "manufacturer":  self._device.get("manufacturer", "Duux"),
-            "model": self._device.get("sensorType", {}).get("name", "Unknown"),
-        }
-
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return self._coordinator.data.get("temp")
+        return self.coordinator.data[self._device_mac].get("temp")
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        return self._coordinator.data.get("sp")
+        return self.coordinator.data[self._device_mac].get("sp")
 
     @property
     def hvac_mode(self):
         """Return current operation."""
-        power = self.coordinator.data.get("power", 0)
+        power = self.coordinator.data[self._device_mac].get("power", 0)
         return HVACMode.HEAT if power == 1 else HVACMode.OFF
 
     @property
@@ -112,60 +108,51 @@ class DuuxClimate(CoordinatorEntity, ClimateEntity):
         # Base implementation - override in subclasses
         return str()
 
-    @property
-    def preset_modes(self):
-        """Return available preset modes."""
-        # Base implementation - override in subclasses
-        return []
-
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        if temperature is not None:
-            await self.hass.async_add_executor_job(
-                self._api.set_temperature, self._device_mac, temperature
-            )
-            await self._coordinator.async_request_refresh()
+        # Store the setpoint the device actually receives
+        temperature = self._api.clamp_temperature(temperature)
+        success = await self._api.async_set_temperature(
+            self._device_mac, temperature
+        )
+        await self._async_apply_state(success, "sp", temperature)
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new HVAC mode."""
-
-        if hvac_mode == HVACMode.HEAT:
-            await self.hass.async_add_executor_job(
-                self._api.set_power, self._device_mac, True
-            )
-        else:
-            await self.hass.async_add_executor_job(
-                self._api.set_power, self._device_mac, False
-            )
-        await self._coordinator.async_request_refresh()
+        power_on = hvac_mode == HVACMode.HEAT
+        success = await self._api.async_set_power(self._device_mac, power_on)
+        await self._async_apply_state(success, "power", 1 if power_on else 0)
 
     async def async_set_preset_mode(self, preset_mode):
         """Set preset mode."""
         # Base implementation - override in subclasses
         pass
 
-    @property
-    def should_poll(self):
-        """No need to poll, coordinator handles it."""
-        return False
+    async def _async_apply_state(self, success, key, value):
+        """Optimistically store a value sent to the device.
+
+        The next poll reconciles the state; a full refresh is only requested
+        when the command failed.
+        """
+        if not success:
+            await self.coordinator.async_request_refresh()
+            return
+        self.coordinator.data[self._device_mac][key] = value
+        self.coordinator.async_update_listeners_by_context({self._device_mac})
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Cache availability before writing the new state."""
+        self._attr_available = self.coordinator.last_update_success
+        super()._handle_coordinator_update()
 
     @property
     def available(self):
         """Return if entity is available."""
-        return self._coordinator.last_update_success
-
-    async def async_added_to_hass(self):
-        """When entity is added to hass."""
-        self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_update(self):
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
+        return self._attr_available
 
 
 class DuuxClimateAutoDiscovery(DuuxClimate):
@@ -175,79 +162,22 @@ class DuuxClimateAutoDiscovery(DuuxClimate):
         """Initialize the climate device."""
         super().__init__(coordinator, api, device)
         self._presets = self.presets_discovery()
+        self._value_to_name = {
+            p["value"]: p["name"] for p in self._presets if p["value"] is not None
+        }
+        self._name_to_command = {p["name"]: p["command"] for p in self._presets}
+        self._name_to_value = {
+            p["name"]: p["value"] for p in self._presets if p["value"] is not None
+        }
+        self._attr_preset_modes = tuple(p["name"] for p in self._presets)
 
     def presets_discovery(self):
-        """Discover available presets."""
-
-        # Guard against coordinator.data being None during initialization
-        modes: Any = (self._coordinator.data or {}).get("availableModes")
-        if modes is None:
-            modes = next(
-                DuuxClimateAutoDiscovery._deep_find(self._device, "availableModes"),
-                None,
-            )
-
-        if isinstance(modes, list):
-            modes = next(
-                (
-                    candidate
-                    for candidate in modes
-                    if isinstance(candidate, dict) and candidate.get("settings")
-                ),
-                None,
-            )
-
-        if not isinstance(modes, dict):
-            _LOGGER.debug("No available modes found")
-            return []
-
-        settings = modes.get("settings")
-        if not isinstance(settings, list):
-            _LOGGER.debug("No settings found in available modes")
-            return []
-
-        command_prefix = (
-            modes.get("command_key") or modes.get("commandKey") or modes.get("key")
-        )
-
+        """Apply model-specific names to the presets found by the coordinator."""
         presets = []
-        for setting in settings:
-            if not isinstance(setting, dict):
-                continue
-
-            name = (
-                setting.get("setting_name")
-                or setting.get("settingName")
-                or setting.get("name")
-            )
-
-            value = (
-                setting.get("setting_value")
-                or setting.get("settingValue")
-                or setting.get("value")
-            )
-
-            name = self._normalize_mode_name(name, value)
-
-            command = setting.get("command")
-            if command is None and command_prefix and value is not None:
-                command = f"{command_prefix} {value}"
-            elif command is None:
-                command = value
-
-            if name and command is not None:
-                normalized_command = str(command)
-                normalized_value = None if value is None else str(value)
-                presets.append(
-                    {
-                        "name": str(name),
-                        "command": normalized_command,
-                        "value": normalized_value,
-                    }
-                )
-
-        _LOGGER.debug("Discovered presets: %s", presets)
-
+        for preset in self.coordinator.presets.get(self._device_mac, []):
+            name = self._normalize_mode_name(preset["name"], preset["value"])
+            if name:
+                presets.append({**preset, "name": str(name)})
         return presets
 
     def _normalize_mode_name(self, name, value: Any) -> Any:
@@ -257,47 +187,33 @@ class DuuxClimateAutoDiscovery(DuuxClimate):
     @property
     def preset_mode(self):
         """Return current preset mode."""
-        mode = self._coordinator.data.get("mode")
-        for preset in self._presets:
-            if preset["value"] == str(mode):
-                return preset["name"]
-        return None
-
-    @property
-    def preset_modes(self):
-        """Return available preset modes."""
-        # Base implementation - override in subclasses if needed
-        return [preset["name"] for preset in self._presets]
+        mode = self.coordinator.data[self._device_mac].get("mode")
+        return self._value_to_name.get(mode)
 
     async def async_set_preset_mode(self, preset_mode):
         """Set preset mode."""
-        for preset in self._presets:
-            if preset["name"] == preset_mode:
-                mode_command = preset["command"]
-                break
+        mode_command = self._name_to_command.get(preset_mode)
+        if mode_command is None:
+            _LOGGER.warning("Unknown preset mode %s", preset_mode)
+            return
 
-        await self.hass.async_add_executor_job(
-            self._api.send_command, self._device_mac, f"tune set {mode_command}"
+        success = await self._api.async_send_command(
+            self._device_mac, f"tune set {mode_command}"
+        )
+        # Without a known mode value there is nothing to store optimistically,
+        # so fall back to a refresh
+        mode_value = self._name_to_value.get(preset_mode)
+        await self._async_apply_state(
+            success and mode_value is not None, "mode", mode_value
         )
-        await self._coordinator.async_request_refresh()
-
-    @staticmethod
-    def _deep_find(obj: Any, key: str) -> Iterator[Any]:
-        """Yield every value for `key` inside a nested dict/list structure."""
-        if isinstance(obj, dict):
-            if key in obj:
-                yield obj[key]
-            for value in obj.values():
-                yield from DuuxClimateAutoDiscovery._deep_find(value, key)
-        elif isinstance(obj, list):
-            for item in obj:
-                yield from DuuxClimateAutoDiscovery._deep_find(item, key)
 
 class DuuxThreesixtyBase(DuuxClimateAutoDiscovery):
     """Shared base for Threesixty devices."""
     PRESET_LOW = PRESET_ECO
     PRESET_HIGH = PRESET_BOOST
     PRESET_MID = PRESET_COMFORT
+
+    _THREESIXTY_VALUE_MAP = {"2": PRESET_ECO, "1": PRESET_COMFORT, "0": PRESET_BOOST}
     
     def __init__(self, coordinator, api, device):
         """Initialize the Threesixty climate device."""
@@ -308,14 +224,7 @@ class DuuxThreesixtyBase(DuuxClimateAutoDiscovery):
 
     def _normalize_mode_name(self, name, value: Any) -> Any:
         """Change the name for the HA presets for Threesixty models."""
-        if value is not None:
-            if value == "2":
-                return PRESET_ECO
-            if value == "1":
-                return PRESET_COMFORT
-            if value == "0":
-                return PRESET_BOOST
-        return name
+        return self._THREESIXTY_VALUE_MAP.get(value, name) if value is not None else name
 
 class DuuxThreesixtyClimate(DuuxThreesixtyBase):
     """Duux Threesixty 2023 heater."""
@@ -329,40 +238,33 @@ class DuuxEdgeClimate(DuuxClimate):
     PRESET_BOOST = PRESET_BOOST
     PRESET_HIGH = PRESET_COMFORT
 
+    _MODE_TO_PRESET = {1: PRESET_LOW, 2: PRESET_HIGH, 3: PRESET_BOOST}
+    _PRESET_TO_MODE = {PRESET_LOW: "1", PRESET_HIGH: "2", PRESET_BOOST: "3"}
+
     def __init__(self, coordinator, api,device):
         """Initialize the Edge climate device."""
         super().__init__(coordinator, api, device)
         # Temperature range for Edge heater
         self._attr_min_temp = 5
         self._attr_max_temp = 36
-    
-    @property
-    def preset_modes(self):
-        """Return available preset modes."""
-        return [self.PRESET_LOW, self.PRESET_HIGH, self.PRESET_BOOST]
+        self._attr_preset_modes = (self.PRESET_LOW, self.PRESET_HIGH, self.PRESET_BOOST)
     
     @property
     def preset_mode(self):
         """Return current preset mode."""
-        mode = self._coordinator.data.get("heatin")
-        mode_map = {
-            1: self.PRESET_LOW,
-            2: self.PRESET_HIGH,
-            3: self.PRESET_BOOST
-        }
-        return mode_map.get(mode, self.PRESET_LOW)
+        mode = self.coordinator.data[self._device_mac].get("heatin")
+        return self._MODE_TO_PRESET.get(mode, self.PRESET_LOW)
     
     async def async_set_preset_mode(self, preset_mode):
         """Set preset mode."""
-        mode_map = {
-            self.PRESET_LOW: "1",
-            self.PRESET_HIGH: "2",
-            self.PRESET_BOOST: "3"
-        }
+        mode = self._PRESET_TO_MODE.get(preset_mode, "1")
 
-        mode = mode_map.get(preset_mode, 1)
+        success = await self._api.async_set_mode(self._device_mac, mode)
+        await self._async_apply_state(success, "heatin", int(mode))
 
-        await self.hass.async_add_executor_job(
-            self._api.set_mode, self._device_mac, mode
-        )
-        await self._coordinator.async_request_refresh()
\ No newline at end of file
+
+_ENTITY_CLASSES: dict[int, type[DuuxClimate]] = {
+    49: DuuxThreesixtyClimate,  # Threesixty 2023
+    50: DuuxEdgeClimate,  # Edge heater v2
+    31: DuuxThreesixtyTwoClimate,  # Threesixty Two (2022)
+}
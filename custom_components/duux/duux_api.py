@@ -11,12 +11,14 @@ _LOGGER = logging.getLogger(__name__)
 class DuuxAPI:
     """Class to communicate with Duux API."""
     
-    def __init__(self, email, password):
+    def __init__(self, email, password, async_session=None):
         """Initialize the API."""
         self.email = email
         self.password = password
         self.token = None
         self.session = requests.Session()
+        # aiohttp session used by the async command helpers
+        self.async_session = async_session
     
     def login(self):
         """Login to Duux API."""
@@ -57,13 +59,17 @@ class DuuxAPI:
             _LOGGER.error(f"Failed to get devices: {e}")
             return []
     
-    def get_device_status(self, device_id):
-        """Get status of a specific device."""
-        devices = self.get_devices()
-        for device in devices:
-            if device.get("deviceId") == device_id:
-                return device.get("latestData", {}).get("fullData", {})
-        return {}
+    async def async_get_devices(self):
+        """Get all Duux devices from the event loop.
+
+        Errors are raised so the coordinator can mark the update as failed.
+        """
+        async with self.async_session.get(
+            f"{API_BASE_URL}{API_SENSORS}",
+            headers={"Authorization": f"{self.token}"}
+        ) as response:
+            response.raise_for_status()
+            return (await response.json()).get('data') or []
     
     def send_command(self, device_mac, command):
         """Send command to device."""
@@ -80,20 +86,41 @@ class DuuxAPI:
             _LOGGER.error(f"Failed to send command: {e}")
             return False
     
-    def set_power(self, device_mac, power_on):
+    async def async_send_command(self, device_mac, command):
+        """Send command to device from the event loop."""
+        try:
+            url = f"{API_BASE_URL}{API_COMMANDS}".replace("{deviceMac}", device_mac)
+            async with self.async_session.post(
+                url,
+                json={"command": command},
+                headers={"Authorization": f"{self.token}"}
+            ) as response:
+                response.raise_for_status()
+            _LOGGER.info(f"Command sent: {command}")
+            return True
+        except Exception as e:
+            _LOGGER.error(f"Failed to send command: {e}")
+            return False
+    
+    async def async_set_power(self, device_mac, power_on):
         """Turn device on or off."""
         value = "01" if power_on else "00"
-        return self.send_command(device_mac, f"tune set power {value}")
+        return await self.async_send_command(device_mac, f"tune set power {value}")
+    
+    @staticmethod
+    def clamp_temperature(temperature):
+        """Return the setpoint the device accepts (whole degrees, 5-36°C)."""
+        return max(5, min(36, int(temperature)))
     
-    def set_temperature(self, device_mac, temperature):
+    async def async_set_temperature(self, device_mac, temperature):
         """Set target temperature (5-36°C)."""
-        temp = max(5, min(36, int(temperature)))
-        return self.send_command(device_mac, f"tune set sp {temp}")
+        temp = self.clamp_temperature(temperature)
+        return await self.async_send_command(device_mac, f"tune set sp {temp}")
     
-    def set_mode(self, device_mac, mode):
+    async def async_set_mode(self, device_mac, mode):
         """Set heater mode (1=Low, 2=High, 3=Boost)."""
         mode_val = max(1, min(3, int(mode)))
-        return self.send_command(device_mac, f"tune set heating {mode_val}")
+        return await self.async_send_command(device_mac, f"tune set heating {mode_val}")
     
     def set_night_mode(self, device_mac, night_on):
         """Set night mode."""
@@ -13,14 +13,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up Duux switch entities from a config entry."""
     data = hass.data[DOMAIN][config_entry.entry_id]
     api = data["api"]
-    coordinators = data["coordinators"]
+    coordinator = data["coordinator"]
     devices = data["devices"]
 
     entities = []
     for device in devices:
         sensor_type_id = device.get("sensorTypeId")
-        device_id = device["deviceId"]
-        coordinator = coordinators[device_id]
 
         # Only Edge heaters have night mode
         if sensor_type_id == 50:  # Edge heater v2
@@ -35,9 +33,9 @@ class DuuxSwitch(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, coordinator, api, device):
         """Initialize the switch."""
-        super().__init__(coordinator)
+        # Only wake up when this device's data changes
+        super().__init__(coordinator, context=device["deviceId"])
         self._api = api
-        self._coordinator = coordinator
         self._device = device
         self._device_id = device["id"]
         self._device_mac = device["deviceId"]  # MAC address
@@ -69,21 +67,21 @@ class DuuxChildLockSwitch(DuuxSwitch):
     @property
     def is_on(self):
         """Return true if child lock is on."""
-        return self.coordinator.data.get("lock") == 1
+        return self.coordinator.data[self._device_mac].get("lock") == 1
 
     async def async_turn_on(self, **kwargs):
         """Turn on child lock."""
         await self.hass.async_add_executor_job(
             self._api.set_lock, self._device_mac, True
         )
-        await self._coordinator.async_request_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn off child lock."""
         await self.hass.async_add_executor_job(
               self._api.set_lock, self._device_mac, False
           )
-        await self._coordinator.async_request_refresh()
+        await self.coordinator.async_request_refresh()
 
 
 class DuuxNightModeSwitch(DuuxSwitch):
@@ -99,18 +97,18 @@ class DuuxNightModeSwitch(DuuxSwitch):
     @property
     def is_on(self):
         """Return true if night mode is on."""
-        return self.coordinator.data.get("night") == 1
+        return self.coordinator.data[self._device_mac].get("night") == 1
 
     async def async_turn_on(self, **kwargs):
         """Turn on night mode."""
         await self.hass.async_add_executor_job(
             self._api.set_night_mode, self._device_mac, True
         )
-        await self._coordinator.async_request_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn off night mode."""
         await self.hass.async_add_executor_job(
               self._api.set_night_mode, self._device_mac, False
           )
-        await self._coordinator.async_request_refresh()
\ No newline at end of file
+        await self.coordinator.async_request_refresh()
\ No newline at end of file